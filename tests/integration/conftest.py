@@ -0,0 +1,31 @@
+import functools
+
+import pytest
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+
+@functools.lru_cache(maxsize=1)
+def chromedriver_path():
+    """Resolve (and possibly download) the chromedriver binary once."""
+    return ChromeDriverManager().install()
+
+
+@pytest.fixture(scope="session")
+def chrome_driver():
+    """Create a Chrome WebDriver instance for the test session"""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-extensions")
+
+    service = Service(chromedriver_path())
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+
+    yield driver
+
+    driver.quit()
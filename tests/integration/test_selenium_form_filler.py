@@ -0,0 +1,310 @@
+import base64
+
+import pytest
+from your_project.selenium_form_filler import SeleniumFormFiller
+from your_project.models import FormConfig, FormField
+
+# Encoded once at import; served as a data: URL so no tempfile is written
+# or cleaned up per test.
+_TEST_HTML = """
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Test Form</title>
+    </head>
+    <body>
+        <form id="test_form">
+            <input type="text" id="text_input" name="text_field" />
+            <input type="email" id="email_input" name="email_field" />
+            <input type="password" id="password_input" name="password_field" />
+
+            <select id="select_input" name="select_field">
+                <option value="option1">Option 1</option>
+                <option value="option2">Option 2</option>
+                <option value="option3">Option 3</option>
+            </select>
+
+            <textarea id="textarea_input" name="textarea_field"></textarea>
+
+            <input type="checkbox" id="checkbox_input" name="checkbox_field" />
+            <label for="checkbox_input">Checkbox</label>
+
+            <input type="radio" id="radio1" name="radio_field" value="radio1" />
+            <label for="radio1">Radio 1</label>
+            <input type="radio" id="radio2" name="radio_field" value="radio2" />
+            <label for="radio2">Radio 2</label>
+
+            <button type="submit" id="submit_btn">Submit</button>
+        </form>
+    </body>
+    </html>
+    """
+
+_TEST_DATA_URL = (
+    "data:text/html;base64," + base64.b64encode(_TEST_HTML.encode()).decode()
+)
+
+
+@pytest.fixture(scope="session")
+def test_html_file():
+    """Return the test form page as a data: URL"""
+    return _TEST_DATA_URL
+
+
+@pytest.fixture(scope="session")
+def form_filler():
+    """Create one SeleniumFormFiller shared by the whole session.
+
+    Browser startup dominates test wall time, so the Chrome process is
+    started once; per-test isolation is handled by the autouse reset
+    fixture below.
+    """
+    filler = SeleniumFormFiller(headless=True, timeout=5)
+    yield filler
+    filler.close()
+
+
+@pytest.fixture(autouse=True)
+def _reset_browser_state(form_filler):
+    """Reset browser state between tests sharing the session driver"""
+    yield
+    try:
+        form_filler.driver.delete_all_cookies()
+        form_filler.driver.get("about:blank")
+    except Exception:
+        pass
+
+
+class TestSeleniumFormFiller:
+
+    def test_fill_text_input(self, form_filler, test_html_file):
+        """Test filling a text input field"""
+        config = FormConfig(
+            url=test_html_file,
+            fields=[
+                FormField(
+                    selector="text_input",
+                    value="Test Text",
+                    selector_type="id",
+                    field_type="input"
+                )
+            ]
+        )
+
+        result = form_filler.fill_form(config)
+        assert result.success == True
+
+        # Verify the field was filled
+        element = form_filler.driver.find_element("id", "text_input")
+        assert element.get_attribute("value") == "Test Text"
+
+    def test_fill_select_field(self, form_filler, test_html_file):
+        """Test selecting an option in a select field"""
+        config = FormConfig(
+            url=test_html_file,
+            fields=[
+                FormField(
+                    selector="select_input",
+                    value="option2",
+                    selector_type="id",
+                    field_type="select"
+                )
+            ]
+        )
+
+        result = form_filler.fill_form(config)
+        assert result.success == True
+
+        # Verify the option was selected
+        element = form_filler.driver.find_element("id", "select_input")
+        assert element.get_attribute("value") == "option2"
+
+    def test_fill_checkbox(self, form_filler, test_html_file):
+        """Test checking a checkbox"""
+        config = FormConfig(
+            url=test_html_file,
+            fields=[
+                FormField(
+                    selector="checkbox_input",
+                    value=True,
+                    selector_type="id",
+                    field_type="checkbox"
+                )
+            ]
+        )
+
+        result = form_filler.fill_form(config)
+        assert result.success == True
+
+        # Verify the checkbox was checked
+        element = form_filler.driver.find_element("id", "checkbox_input")
+        assert element.is_selected() == True
+
+    def test_fill_radio_button(self, form_filler, test_html_file):
+        """Test selecting a radio button"""
+        config = FormConfig(
+            url=test_html_file,
+            fields=[
+                FormField(
+                    selector="radio2",
+                    value=True,
+                    selector_type="id",
+                    field_type="radio"
+                )
+            ]
+        )
+
+        result = form_filler.fill_form(config)
+        assert result.success == True
+
+        # Verify the radio button was selected
+        element = form_filler.driver.find_element("id", "radio2")
+        assert element.is_selected() == True
+
+    def test_fill_multiple_fields(self, form_filler, test_html_file):
+        """Test filling multiple fields in sequence"""
+        config = FormConfig(
+            url=test_html_file,
+            fields=[
+                FormField(
+                    selector="text_input",
+                    value="John Doe",
+                    selector_type="id",
+                    field_type="input"
+                ),
+                FormField(
+                    selector="email_input",
+                    value="john@example.com",
+                    selector_type="id",
+                    field_type="input"
+                ),
+                FormField(
+                    selector="select_input",
+                    value="option3",
+                    selector_type="id",
+                    field_type="select"
+                ),
+                FormField(
+                    selector="checkbox_input",
+                    value=True,
+                    selector_type="id",
+                    field_type="checkbox"
+                )
+            ]
+        )
+
+        result = form_filler.fill_form(config)
+        assert result.success == True
+        assert len(result.filled_fields) == 4
+
+        # Verify all fields were filled correctly
+        text_element = form_filler.driver.find_element("id", "text_input")
+        assert text_element.get_attribute("value") == "John Doe"
+
+        email_element = form_filler.driver.find_element("id", "email_input")
+        assert email_element.get_attribute("value") == "john@example.com"
+
+        select_element = form_filler.driver.find_element("id", "select_input")
+        assert select_element.get_attribute("value") == "option3"
+
+        checkbox_element = form_filler.driver.find_element("id", "checkbox_input")
+        assert checkbox_element.is_selected() == True
+
+    def test_element_not_found(self, form_filler, test_html_file):
+        """Test handling of element not found scenario"""
+        config = FormConfig(
+            url=test_html_file,
+            fields=[
+                FormField(
+                    selector="nonexistent_field",
+                    value="test",
+                    selector_type="id",
+                    field_type="input"
+                )
+            ]
+        )
+
+        result = form_filler.fill_form(config)
+        assert result.success == False
+        assert len(result.errors) == 1
+        assert "Element not found" in result.errors[0]
+
+    def test_form_submission(self, form_filler, test_html_file):
+        """Test form submission after filling fields"""
+        config = FormConfig(
+            url=test_html_file,
+            fields=[
+                FormField(
+                    selector="text_input",
+                    value="Test",
+                    selector_type="id",
+                    field_type="input"
+                )
+            ],
+            submit_selector="submit_btn",
+            submit_selector_type="id"
+        )
+
+        result = form_filler.fill_form(config)
+        assert result.success == True
+        assert result.submitted == True
+
+    def test_screenshot_capture(self, form_filler, test_html_file, tmp_path):
+        """Test screenshot capture functionality"""
+        screenshot_path = tmp_path / "test_screenshot"
+
+        config = FormConfig(
+            url=test_html_file,
+            fields=[
+                FormField(
+                    selector="text_input",
+                    value="Test",
+                    selector_type="id",
+                    field_type="input"
+                )
+            ],
+            screenshot_path=str(screenshot_path)
+        )
+
+        result = form_filler.fill_form(config)
+        assert result.success == True
+
+        # Verify screenshots were created
+        assert (screenshot_path.parent / f"{screenshot_path.name}_before.png").exists()
+        assert (screenshot_path.parent / f"{screenshot_path.name}_after.png").exists()
+
+    def test_different_selector_types(self, form_filler, test_html_file):
+        """Test different selector types (id, name, css, xpath)"""
+        config = FormConfig(
+            url=test_html_file,
+            fields=[
+                FormField(
+                    selector="text_input",
+                    value="Test ID",
+                    selector_type="id",
+                    field_type="input"
+                ),
+                FormField(
+                    selector="email_field",
+                    value="test@example.com",
+                    selector_type="name",
+                    field_type="input"
+                ),
+                FormField(
+                    selector="#password_input",
+                    value="password123",
+                    selector_type="css",
+                    field_type="input"
+                ),
+                FormField(
+                    selector="//textarea[@id='textarea_input']",
+                    value="Test message",
+                    selector_type="xpath",
+                    field_type="textarea"
+                )
+            ]
+        )
+
+        result = form_filler.fill_form(config)
+        assert result.success == True
+        assert len(result.filled_fields) == 4
@@ -0,0 +1,168 @@
+import pytest
+from your_project.config_manager import ConfigManager, ConfigurationError
+from your_project.models import FormConfig, FormField
+
+
+class TestConfigManager:
+
+    def test_load_yaml_with_env_substitution(self, monkeypatch, tmp_path):
+        """Test YAML loading with environment variable substitution"""
+        # Set environment variable
+        monkeypatch.setenv("TEST_PASSWORD", "secret123")
+        monkeypatch.setenv("TEST_URL", "https://example.com")
+
+        # Create a dummy yaml file
+        yaml_content = """
+        url: "${TEST_URL}/form"
+        fields:
+          - selector: "username"
+            value: "testuser"
+            selector_type: "id"
+            field_type: "input"
+          - selector: "password"
+            value: "${TEST_PASSWORD}"
+            selector_type: "id"
+            field_type: "input"
+        submit_selector: "submit_btn"
+        wait_after_fill: 2
+        """
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml_content)
+
+        manager = ConfigManager()
+        config = manager.load_from_yaml(str(config_file))
+
+        assert config.url == "https://example.com/form"
+        assert len(config.fields) == 2
+        assert config.fields[0].value == "testuser"
+        assert config.fields[1].value == "secret123"
+        assert config.submit_selector == "submit_btn"
+        assert config.wait_after_fill == 2
+
+    def test_load_yaml_missing_env_variable(self, tmp_path):
+        """Test YAML loading with missing environment variable"""
+        yaml_content = """
+        url: "${MISSING_VAR}/form"
+        fields: []
+        """
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml_content)
+
+        manager = ConfigManager()
+        with pytest.raises(ConfigurationError, match="Environment variable MISSING_VAR not found"):
+            manager.load_from_yaml(str(config_file))
+
+    def test_load_yaml_invalid_format(self, tmp_path):
+        """Test YAML loading with invalid format"""
+        yaml_content = """
+        url: "https://example.com"
+        # Missing required fields
+        """
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml_content)
+
+        manager = ConfigManager()
+        with pytest.raises(ConfigurationError, match="Missing required field: fields"):
+            manager.load_from_yaml(str(config_file))
+
+    def test_load_json_with_env_substitution(self, monkeypatch, tmp_path):
+        """Test JSON loading with environment variable substitution"""
+        monkeypatch.setenv("API_KEY", "abc123")
+
+        json_content = """{
+            "url": "https://api.example.com",
+            "fields": [
+                {
+                    "selector": "api_key",
+                    "value": "${API_KEY}",
+                    "selector_type": "name",
+                    "field_type": "input"
+                }
+            ]
+        }"""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json_content)
+
+        manager = ConfigManager()
+        config = manager.load_from_json(str(config_file))
+
+        assert config.fields[0].value == "abc123"
+
+    def test_validate_config_missing_url(self):
+        """Test config validation with missing URL"""
+        config_data = {
+            "fields": []
+        }
+
+        manager = ConfigManager()
+        with pytest.raises(ConfigurationError, match="Missing required field: url"):
+            manager._validate_config(config_data)
+
+    def test_validate_config_invalid_field(self):
+        """Test config validation with invalid field"""
+        config_data = {
+            "url": "https://example.com",
+            "fields": [
+                {
+                    "selector": "test",
+                    # Missing required 'value' field
+                    "selector_type": "id"
+                }
+            ]
+        }
+
+        manager = ConfigManager()
+        with pytest.raises(ConfigurationError, match="Field missing required property: value"):
+            manager._validate_config(config_data)
+
+    def test_load_many_preserves_order(self, tmp_path):
+        """Test concurrent loading of multiple config files"""
+        paths = []
+        for i in range(3):
+            yaml_content = f"""
+            url: "https://example.com/form{i}"
+            fields:
+              - selector: "field{i}"
+                value: "value{i}"
+            """
+            config_file = tmp_path / f"config{i}.yaml"
+            config_file.write_text(yaml_content)
+            paths.append(str(config_file))
+
+        manager = ConfigManager()
+        configs = manager.load_many(paths)
+
+        assert len(configs) == 3
+        for i, config in enumerate(configs):
+            assert config.url == f"https://example.com/form{i}"
+            assert config.fields[0].selector == f"field{i}"
+
+    def test_save_and_load_yaml_roundtrip(self, tmp_path):
+        """Test saving and loading YAML maintains data integrity"""
+        original_config = FormConfig(
+            url="https://test.com",
+            fields=[
+                FormField(
+                    selector="test_field",
+                    value="test_value",
+                    selector_type="id",
+                    field_type="input"
+                )
+            ],
+            submit_selector="submit"
+        )
+
+        config_file = tmp_path / "test_config.yaml"
+        manager = ConfigManager()
+
+        # Save config
+        manager.save_to_yaml(original_config, str(config_file))
+
+        # Load config
+        loaded_config = manager.load_from_yaml(str(config_file))
+
+        assert loaded_config.url == original_config.url
+        assert len(loaded_config.fields) == len(original_config.fields)
+        assert loaded_config.fields[0].selector == original_config.fields[0].selector
+        assert loaded_config.fields[0].value == original_config.fields[0].value
+        assert loaded_config.submit_selector == original_config.submit_selector
@@ -0,0 +1,136 @@
+import pytest
+from your_project.models import FormField, FormConfig
+from your_project.exceptions import ValidationError
+
+
+class TestFormField:
+
+    def test_validate_value_string(self):
+        """Test string value validation"""
+        field = FormField(
+            selector="test",
+            value="test_string",
+            field_type="input"
+        )
+
+        assert field.validate_value() == "test_string"
+
+    def test_validate_value_integer(self):
+        """Test integer value validation"""
+        field = FormField(
+            selector="test",
+            value=42,
+            field_type="input"
+        )
+
+        assert field.validate_value() == "42"
+
+    def test_validate_value_boolean_checkbox(self):
+        """Test boolean value for checkbox"""
+        field = FormField(
+            selector="test",
+            value=True,
+            field_type="checkbox"
+        )
+
+        assert field.validate_value() == True
+
+    def test_validate_value_boolean_non_checkbox(self):
+        """Test boolean value for non-checkbox field"""
+        field = FormField(
+            selector="test",
+            value=True,
+            field_type="input"
+        )
+
+        with pytest.raises(
+            ValidationError,
+            match="Boolean values only allowed for checkbox and radio fields"
+        ):
+            field.validate_value()
+
+    def test_validate_value_string_checkbox(self):
+        """Test string value for checkbox field"""
+        field = FormField(
+            selector="test",
+            value="false",
+            field_type="checkbox"
+        )
+
+        with pytest.raises(
+            ValidationError,
+            match="Checkbox and radio fields require a boolean value"
+        ):
+            field.validate_value()
+
+    def test_validate_selector_type(self):
+        """Test selector type validation"""
+        with pytest.raises(ValidationError, match="Invalid selector_type"):
+            FormField(
+                selector="test",
+                value="test",
+                selector_type="invalid_type"
+            )
+
+    def test_validate_field_type(self):
+        """Test field type validation"""
+        with pytest.raises(ValidationError, match="Invalid field_type"):
+            FormField(
+                selector="test",
+                value="test",
+                field_type="invalid_type"
+            )
+
+    def test_validate_empty_selector(self):
+        """Test empty selector validation"""
+        with pytest.raises(ValidationError, match="Selector cannot be empty"):
+            FormField(
+                selector="",
+                value="test"
+            )
+
+    def test_validate_none_value(self):
+        """Test None value validation"""
+        with pytest.raises(ValidationError, match="Value cannot be None"):
+            FormField(
+                selector="test",
+                value=None
+            )
+
+
+class TestFormConfig:
+
+    def test_validate_empty_url(self):
+        """Test empty URL validation"""
+        with pytest.raises(ValidationError, match="URL cannot be empty"):
+            FormConfig(
+                url="",
+                fields=[]
+            )
+
+    def test_validate_invalid_url(self):
+        """Test invalid URL validation"""
+        with pytest.raises(ValidationError, match="Invalid URL format"):
+            FormConfig(
+                url="not-a-url",
+                fields=[]
+            )
+
+    def test_validate_empty_fields(self):
+        """Test empty fields validation"""
+        with pytest.raises(ValidationError, match="At least one field must be specified"):
+            FormConfig(
+                url="https://example.com",
+                fields=[]
+            )
+
+    def test_validate_negative_wait_time(self):
+        """Test negative wait time validation"""
+        field = FormField(selector="test", value="test")
+
+        with pytest.raises(ValidationError, match="Wait times must be non-negative"):
+            FormConfig(
+                url="https://example.com",
+                fields=[field],
+                wait_after_fill=-1
+            )
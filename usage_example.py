@@ -0,0 +1,33 @@
+"""Example entrypoint: fill the form described by production_form_config.yaml."""
+
+import logging
+
+from dotenv import load_dotenv
+
+from your_project.config_manager import ConfigManager
+from your_project.logger import configure_logging, get_logger
+from your_project.selenium_form_filler import SeleniumFormFiller
+
+
+def main() -> None:
+    load_dotenv()
+    configure_logging(logging.INFO)
+    logger = get_logger(__name__)
+
+    config = ConfigManager().load_from_yaml("production_form_config.yaml")
+
+    filler = SeleniumFormFiller(headless=True, timeout=config.page_load_timeout)
+    try:
+        result = filler.fill_form(config)
+    finally:
+        filler.close()
+
+    if result.success:
+        logger.info("run.success", filled=result.filled_fields, submitted=result.submitted)
+    else:
+        logger.error("run.failed", errors=result.errors)
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
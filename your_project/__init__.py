@@ -0,0 +1,21 @@
+"""Configuration-driven web form automation."""
+
+from .config_manager import ConfigManager
+from .exceptions import (
+    ConfigurationError,
+    ElementNotFoundError,
+    FormAutomatorError,
+    ValidationError,
+)
+from .models import FillResult, FormConfig, FormField
+
+__all__ = [
+    "ConfigManager",
+    "ConfigurationError",
+    "ElementNotFoundError",
+    "FillResult",
+    "FormAutomatorError",
+    "FormConfig",
+    "FormField",
+    "ValidationError",
+]
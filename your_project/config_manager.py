@@ -0,0 +1,301 @@
+"""Loading, validation and persistence of form configurations."""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from dataclasses import fields as _dc_fields
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+try:  # libyaml C tokenizer; 3-10x faster than the pure-Python loader
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json  # type: ignore[no-redef]
+
+from .exceptions import ConfigurationError
+from .models import FormConfig, FormField
+
+_ENV_RE = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+# Required keys, in declaration order for stable diagnostics, plus frozen
+# sets so the presence check is a single set difference per mapping.
+_REQUIRED_TOP = ("url", "fields")
+_REQUIRED_FIELD = ("selector", "value")
+_REQUIRED_TOP_SET = frozenset(_REQUIRED_TOP)
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELD)
+
+
+def _read_bytes(path: str) -> bytes:
+    """Slurp a file in one unbuffered read; the parsers decode UTF-8
+    themselves, so the text-mode decoder never runs."""
+    with open(path, "rb", buffering=0) as f:
+        return f.read()
+
+
+def _walk_strings(root: Any) -> Dict[str, str]:
+    """Interpolate env vars into every string leaf of a parsed config.
+
+    Iterative (explicit stack) rather than recursive, and mutates the
+    containers in place. YAML/JSON parsers only produce plain dicts and
+    lists, so exact type checks suffice. Resolved variables are memoized
+    for the duration of one walk, so a variable referenced many times in
+    a config hits os.environ once; the resolved map is returned so the
+    cache can detect when an environment variable has since changed.
+    """
+    resolved: Dict[str, str] = {}
+
+    def repl(match: "re.Match[str]") -> str:
+        name = match.group(1)
+        value = resolved.get(name)
+        if value is None:
+            try:
+                value = os.environ[name]
+            except KeyError:
+                raise ConfigurationError(
+                    f"Environment variable {name} not found"
+                ) from None
+            resolved[name] = value
+        return value
+
+    def interp(s: str) -> str:
+        # Variable-free strings are returned unchanged without entering
+        # the regex engine.
+        return _ENV_RE.sub(repl, s) if "${" in s else s
+
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if type(node) is dict:
+            for k, v in node.items():
+                if type(v) is str:
+                    node[k] = interp(v)
+                elif type(v) in (dict, list):
+                    stack.append(v)
+        elif type(node) is list:
+            for i, v in enumerate(node):
+                if type(v) is str:
+                    node[i] = interp(v)
+                elif type(v) in (dict, list):
+                    stack.append(v)
+    return resolved
+
+
+class ConfigManager:
+    """Loads and validates form configurations from YAML or JSON files.
+
+    Fully validated configurations are cached in-process, keyed by
+    absolute path and the file's ``(st_mtime_ns, st_size)`` signature, so
+    repeated loads of an unchanged file skip parsing and validation
+    entirely. The cache is bounded LRU; stale entries are replaced when
+    the file changes on disk, and each entry remembers the environment
+    variables it was resolved with so hits never return values from a
+    since-changed environment.
+    """
+
+    #: cache entry: (stat signature, resolved env vars, config)
+    _Entry = Tuple[Tuple[int, int], Dict[str, str], FormConfig]
+
+    def __init__(self) -> None:
+        self._cache: "OrderedDict[str, ConfigManager._Entry]" = OrderedDict()
+        self._cache_max = 64
+        self._cache_lock = threading.Lock()
+
+    def load_from_yaml(self, path: str) -> FormConfig:
+        """Load a form configuration from a YAML file."""
+        key, sig = self._stat_key(path)
+        cached = self._cache_get(key, sig)
+        if cached is not None:
+            return cached
+        buf = _read_bytes(path)
+        try:
+            data = yaml.load(buf, Loader=_YamlLoader)
+        except yaml.YAMLError as exc:
+            raise ConfigurationError(f"Invalid YAML in {path}: {exc}") from exc
+        return self._finish_load(key, sig, data, interpolate=b"${" in buf)
+
+    def load_from_json(self, path: str) -> FormConfig:
+        """Load a form configuration from a JSON file."""
+        key, sig = self._stat_key(path)
+        cached = self._cache_get(key, sig)
+        if cached is not None:
+            return cached
+        buf = _read_bytes(path)
+        try:
+            data = _json.loads(buf)
+        except ValueError as exc:
+            raise ConfigurationError(f"Invalid JSON in {path}: {exc}") from exc
+        return self._finish_load(key, sig, data, interpolate=b"${" in buf)
+
+    def load_many(
+        self, paths: Iterable[str], kind: str = "yaml", workers: int = 8
+    ) -> List[FormConfig]:
+        """Load several configuration files concurrently, preserving order.
+
+        File reads and the libyaml/orjson parsers release the GIL for
+        most of their work, so a small thread pool overlaps batch loads
+        well. The config cache is shared and thread-safe.
+        """
+        loader = self.load_from_yaml if kind == "yaml" else self.load_from_json
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(loader, paths))
+
+    def save_to_yaml(self, config: FormConfig, path: str) -> None:
+        """Write a form configuration to a YAML file."""
+        text = yaml.dump(
+            self._serialize(config),
+            Dumper=_YamlDumper,
+            sort_keys=False,
+            default_flow_style=False,
+            allow_unicode=True,
+        )
+        with open(path, "wb") as f:
+            f.write(text.encode("utf-8"))
+        self.invalidate(path)
+
+    def _serialize(self, config: FormConfig) -> Dict[str, Any]:
+        """Convert a FormConfig to a plain dict of its public fields."""
+
+        def public(obj: Any) -> Dict[str, Any]:
+            return {
+                f.name: getattr(obj, f.name)
+                for f in _dc_fields(obj)
+                if not f.name.startswith("_")
+            }
+
+        data = public(config)
+        data["fields"] = [public(fld) for fld in config.fields]
+        return data
+
+    def invalidate(self, path: str) -> None:
+        """Drop the cached configuration for ``path``, if any."""
+        with self._cache_lock:
+            self._cache.pop(os.path.abspath(path), None)
+
+    def clear_cache(self) -> None:
+        """Drop every cached configuration."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _stat_key(self, path: str) -> Tuple[str, Tuple[int, int]]:
+        key = os.path.abspath(path)
+        try:
+            st = os.stat(key)
+        except OSError as exc:
+            raise ConfigurationError(
+                f"Cannot read configuration file {path}: {exc}"
+            ) from exc
+        return key, (st.st_mtime_ns, st.st_size)
+
+    def _cache_get(self, key: str, sig: Tuple[int, int]) -> Optional[FormConfig]:
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None or entry[0] != sig:
+                return None
+            env = entry[1]
+            if any(os.environ.get(name) != value for name, value in env.items()):
+                # An interpolated variable changed (e.g. a rotated
+                # secret); the entry is stale even though the file isn't.
+                return None
+            self._cache.move_to_end(key)
+            config = entry[2]
+        # Deep-copy (outside the lock) so callers cannot mutate the
+        # cached configuration.
+        return deepcopy(config)
+
+    def _finish_load(
+        self,
+        key: str,
+        sig: Tuple[int, int],
+        data: Dict[str, Any],
+        interpolate: bool = True,
+    ) -> FormConfig:
+        # Callers pass interpolate=False when one scan of the raw bytes
+        # found no "${", skipping the walk entirely for the common case
+        # of placeholder-free configs.
+        env = _walk_strings(data) if interpolate else {}
+        config = self._build_config(data)
+        with self._cache_lock:
+            self._cache[key] = (sig, env, config)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_max:
+                self._cache.popitem(last=False)
+        return deepcopy(config)
+
+    def _validate_config(self, config_data: Dict[str, Any]) -> None:
+        """Check that the parsed configuration has the required structure.
+
+        All structural problems are collected in one pass and reported in
+        a single ConfigurationError rather than failing on the first.
+        """
+        if not isinstance(config_data, dict):
+            raise ConfigurationError("Configuration root must be a mapping")
+        errors: List[str] = []
+        top_missing = _REQUIRED_TOP_SET - config_data.keys()
+        if top_missing:
+            errors.extend(
+                f"Missing required field: {key}"
+                for key in _REQUIRED_TOP
+                if key in top_missing
+            )
+        for field in config_data.get("fields", ()):
+            if not isinstance(field, dict):
+                errors.append("Each field must be a mapping")
+                continue
+            field_missing = _REQUIRED_FIELD_SET - field.keys()
+            if field_missing:
+                errors.extend(
+                    f"Field missing required property: {prop}"
+                    for prop in _REQUIRED_FIELD
+                    if prop in field_missing
+                )
+        if errors:
+            raise ConfigurationError("; ".join(errors))
+
+    def _build_config(self, config_data: Dict[str, Any]) -> FormConfig:
+        """Validate and construct in a single pass.
+
+        Only missing keys need checking here — the dataclasses'
+        __post_init__ already validates values during construction, so a
+        separate _validate_config walk before building would re-check
+        every field. _validate_config remains available for callers that
+        want structure errors without constructing anything.
+        """
+        if not isinstance(config_data, dict):
+            raise ConfigurationError("Configuration root must be a mapping")
+        top_missing = _REQUIRED_TOP_SET - config_data.keys()
+        if top_missing:
+            key = next(k for k in _REQUIRED_TOP if k in top_missing)
+            raise ConfigurationError(f"Missing required field: {key}")
+        form_fields = []
+        for field in config_data["fields"]:
+            if not isinstance(field, dict):
+                raise ConfigurationError("Each field must be a mapping")
+            field_missing = _REQUIRED_FIELD_SET - field.keys()
+            if field_missing:
+                prop = next(p for p in _REQUIRED_FIELD if p in field_missing)
+                raise ConfigurationError(f"Field missing required property: {prop}")
+            try:
+                form_fields.append(FormField(**field))
+            except TypeError as exc:
+                # e.g. an unknown key in the field mapping
+                raise ConfigurationError(f"Invalid field definition: {exc}") from None
+        data = dict(config_data)
+        data["fields"] = form_fields
+        try:
+            return FormConfig(**data)
+        except TypeError as exc:
+            raise ConfigurationError(f"Invalid configuration: {exc}") from None
@@ -0,0 +1,17 @@
+"""Custom exceptions for the form automator."""
+
+
+class FormAutomatorError(Exception):
+    """Base class for all form automator errors."""
+
+
+class ConfigurationError(FormAutomatorError):
+    """Raised when a configuration file is missing, malformed or incomplete."""
+
+
+class ValidationError(FormAutomatorError):
+    """Raised when a model fails validation."""
+
+
+class ElementNotFoundError(FormAutomatorError):
+    """Raised when an element cannot be located on the page."""
@@ -0,0 +1,154 @@
+"""Data models for form automation configuration."""
+
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .exceptions import ValidationError
+
+# dataclass(slots=True) requires Python 3.10; on the older interpreters
+# in the support matrix instances simply keep a __dict__.
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Accepts any RFC 3986 scheme (https, file, data, ...) followed by a
+# non-empty, whitespace-free remainder. One DFA scan instead of urlparse.
+_URL_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*:\S+")
+
+VALID_SELECTOR_TYPES = frozenset({"id", "name", "css", "xpath"})
+VALID_FIELD_TYPES = frozenset({"input", "textarea", "select", "checkbox", "radio"})
+
+
+def _same(value: Any) -> Any:
+    return value
+
+
+def _reject_bool(value: Any) -> Any:
+    raise ValidationError("Boolean values only allowed for checkbox and radio fields")
+
+
+def _reject_non_bool(value: Any) -> Any:
+    raise ValidationError("Checkbox and radio fields require a boolean value")
+
+
+def _reject_unknown(value: Any) -> Any:
+    raise ValidationError(
+        f"Unsupported value type for form field: {type(value).__name__}"
+    )
+
+
+# Coercion dispatch keyed on (field_type, exact value type); built once at
+# import so validate_value is a single dict lookup instead of an if/elif
+# chain. bool keys take precedence over int because type() is exact.
+# Checkbox/radio accept bool only: a quoted "false" in a config is truthy
+# and would silently do the opposite of what it says.
+_COERCE: Dict[Tuple[str, type], Callable[[Any], Any]] = {}
+for _ft in VALID_FIELD_TYPES:
+    if _ft in ("checkbox", "radio"):
+        _COERCE[(_ft, str)] = _reject_non_bool
+        _COERCE[(_ft, int)] = _reject_non_bool
+        _COERCE[(_ft, float)] = _reject_non_bool
+        _COERCE[(_ft, bool)] = _same
+    else:
+        _COERCE[(_ft, str)] = _same
+        _COERCE[(_ft, int)] = str
+        _COERCE[(_ft, float)] = str
+        _COERCE[(_ft, bool)] = _reject_bool
+del _ft
+
+
+@dataclass(frozen=True, init=False, **_SLOTS)
+class FormField:
+    """A single field to locate and fill on a form.
+
+    Frozen, and slotted on Python 3.10+: instances are immutable, carry
+    no per-instance ``__dict__``, and are safe to share (e.g. from the
+    config cache).
+    ``init=False``: construction is hand-written so large configs pay
+    inline validation plus direct slot writes per field, rather than the
+    generated ``__init__`` and a ``__post_init__`` dispatch on top.
+    """
+
+    selector: str
+    value: Any
+    selector_type: str = "id"
+    field_type: str = "input"
+    required: bool = True
+    # Memoized validate_value() result; never a legitimate value itself
+    # because None values are rejected at construction.
+    _validated: Any = field(default=None, init=False, compare=False, repr=False)
+
+    def __init__(
+        self,
+        selector: str,
+        value: Any,
+        selector_type: str = "id",
+        field_type: str = "input",
+        required: bool = True,
+    ) -> None:
+        if not selector:
+            raise ValidationError("Selector cannot be empty")
+        if value is None:
+            raise ValidationError("Value cannot be None")
+        if selector_type not in VALID_SELECTOR_TYPES:
+            raise ValidationError(f"Invalid selector_type: {selector_type}")
+        if field_type not in VALID_FIELD_TYPES:
+            raise ValidationError(f"Invalid field_type: {field_type}")
+        _set = object.__setattr__
+        _set(self, "selector", selector)
+        _set(self, "value", value)
+        _set(self, "selector_type", selector_type)
+        _set(self, "field_type", field_type)
+        _set(self, "required", required)
+        _set(self, "_validated", None)
+
+    def validate_value(self) -> Any:
+        """Return the value coerced to what gets sent to the browser.
+
+        The coerced result is memoized on the instance, so repeated calls
+        (e.g. across fill retries) cost one attribute read.
+        """
+        cached = self._validated
+        if cached is not None:
+            return cached
+        coerce = _COERCE.get((self.field_type, type(self.value)), _reject_unknown)
+        result = coerce(self.value)
+        object.__setattr__(self, "_validated", result)
+        return result
+
+
+@dataclass(frozen=True, **_SLOTS)
+class FormConfig:
+    """A complete description of one form-filling run."""
+
+    url: str
+    fields: List[FormField]
+    submit_selector: Optional[str] = None
+    submit_selector_type: str = "id"
+    wait_after_fill: int = 0
+    page_load_timeout: int = 30
+    screenshot_path: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if not self.url:
+            raise ValidationError("URL cannot be empty")
+        if not _URL_RE.fullmatch(self.url):
+            raise ValidationError(f"Invalid URL format: {self.url}")
+        if not self.fields:
+            raise ValidationError("At least one field must be specified")
+        if self.submit_selector_type not in VALID_SELECTOR_TYPES:
+            raise ValidationError(
+                f"Invalid submit_selector_type: {self.submit_selector_type}"
+            )
+        if self.wait_after_fill < 0 or self.page_load_timeout < 0:
+            raise ValidationError("Wait times must be non-negative")
+
+
+@dataclass
+class FillResult:
+    """Outcome of a ``fill_form`` run."""
+
+    success: bool = True
+    filled_fields: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    submitted: bool = False
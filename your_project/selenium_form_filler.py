@@ -0,0 +1,244 @@
+"""Core Selenium automation logic for filling and submitting forms."""
+
+import base64
+import os
+import time
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from .exceptions import ElementNotFoundError, FormAutomatorError, ValidationError
+from .logger import get_logger
+from .models import FillResult, FormConfig, FormField
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
+
+logger = get_logger(__name__)
+
+# selector_type -> locator strategy. These are the literal values of the
+# selenium By.* constants, spelled out so importing this module does not
+# pull in the Selenium import chain; selector types are validated at
+# FormField construction, so lookups here cannot miss.
+_BY = {
+    "id": "id",
+    "name": "name",
+    "css": "css selector",
+    "xpath": "xpath",
+}
+
+# Resolves every selector in-browser in one WebDriver round-trip; entries
+# that match nothing come back as null.
+_BATCH_LOOKUP_JS = """
+return arguments[0].map(function (a) {
+  switch (a.t) {
+    case 'id': return document.getElementById(a.s);
+    case 'name': return document.getElementsByName(a.s)[0] || null;
+    case 'css': return document.querySelector(a.s);
+    case 'xpath':
+      return document.evaluate(
+        a.s, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+      ).singleNodeValue;
+  }
+  return null;
+});
+"""
+
+
+def _fill_text(element: "WebElement", value: Any) -> None:
+    element.clear()
+    element.send_keys(value)
+
+
+def _fill_select(element: "WebElement", value: Any) -> None:
+    # Sets the value and fires input/change in one script call; Select()
+    # would round-trip over the wire for each <option> until it matched.
+    value = str(value)
+    matched = element.parent.execute_script(
+        "var e = arguments[0], v = arguments[1];"
+        "var ok = Array.prototype.some.call("
+        "  e.options, function (o) { return o.value === v; });"
+        "if (!ok) return false;"
+        "e.value = v;"
+        "e.dispatchEvent(new Event('input', {bubbles: true}));"
+        "e.dispatchEvent(new Event('change', {bubbles: true}));"
+        "return true;",
+        element,
+        value,
+    )
+    if not matched:
+        raise ValidationError(f"No select option with value: {value}")
+
+
+def _fill_checkbox(element: "WebElement", value: Any) -> None:
+    if element.is_selected() != value:
+        element.click()
+
+
+def _fill_radio(element: "WebElement", value: Any) -> None:
+    if value and not element.is_selected():
+        element.click()
+
+
+# field_type -> filler, built once; field types are validated at FormField
+# construction, so the per-field dispatch is a single dict lookup.
+_FILLERS = {
+    "input": _fill_text,
+    "textarea": _fill_text,
+    "select": _fill_select,
+    "checkbox": _fill_checkbox,
+    "radio": _fill_radio,
+}
+
+
+class SeleniumFormFiller:
+    """Fills and submits web forms described by a :class:`FormConfig`."""
+
+    def __init__(self, headless: bool = True, timeout: int = 10) -> None:
+        self.timeout = timeout
+        self.driver: Optional["WebDriver"] = self._create_driver(headless)
+
+    def _create_driver(self, headless: bool) -> "WebDriver":
+        # Deferred so importing this module (e.g. during unit-test
+        # collection) never pays the Selenium import chain.
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        options = Options()
+        if headless:
+            options.add_argument("--headless")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        service = Service(ChromeDriverManager().install())
+        return webdriver.Chrome(service=service, options=options)
+
+    def fill_form(self, config: FormConfig) -> FillResult:
+        """Navigate to the configured URL, fill every field and submit."""
+        if self.driver is None:
+            raise FormAutomatorError("WebDriver has been closed")
+        result = FillResult()
+        logger.info("fill_form.start", url=config.url, fields=len(config.fields))
+        self.driver.get(config.url)
+
+        if config.screenshot_path:
+            self._take_screenshot(f"{config.screenshot_path}_before.png")
+
+        elements = self._find_elements_batch(config.fields)
+        for field, element in zip(config.fields, elements):
+            try:
+                if element is None:
+                    element = self._find_element(field.selector, field.selector_type)
+                self._fill_field(element, field)
+                result.filled_fields.append(field.selector)
+            except (ElementNotFoundError, ValidationError) as exc:
+                logger.warning("fill_form.field_error", selector=field.selector, error=str(exc))
+                result.errors.append(str(exc))
+                if field.required:
+                    result.success = False
+
+        if config.submit_selector and result.success:
+            try:
+                button = self._find_element(
+                    config.submit_selector, config.submit_selector_type
+                )
+                button.click()
+                result.submitted = True
+            except ElementNotFoundError as exc:
+                result.errors.append(str(exc))
+                result.success = False
+
+        if config.wait_after_fill:
+            time.sleep(config.wait_after_fill)
+
+        if config.screenshot_path:
+            self._take_screenshot(f"{config.screenshot_path}_after.png")
+
+        logger.info(
+            "fill_form.done",
+            success=result.success,
+            filled=len(result.filled_fields),
+            errors=len(result.errors),
+        )
+        return result
+
+    def close(self) -> None:
+        """Shut down the underlying WebDriver."""
+        if self.driver is not None:
+            self.driver.quit()
+            self.driver = None
+
+    def _find_elements_batch(
+        self, fields: List[FormField]
+    ) -> List[Optional["WebElement"]]:
+        """Resolve all field selectors in a single WebDriver round-trip.
+
+        Returns a list parallel to ``fields``; unmatched selectors are
+        None and fall back to the per-field explicit wait, which keeps
+        the original timeout semantics for late-appearing elements.
+        """
+        from selenium.common.exceptions import WebDriverException
+
+        assert self.driver is not None
+
+        payload = [{"t": f.selector_type, "s": f.selector} for f in fields]
+        try:
+            found = self.driver.execute_script(_BATCH_LOOKUP_JS, payload)
+        except WebDriverException:
+            return [None] * len(fields)
+        if not isinstance(found, list) or len(found) != len(fields):
+            return [None] * len(fields)
+        return found
+
+    def _find_element(self, selector: str, selector_type: str) -> "WebElement":
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        assert self.driver is not None
+        by = _BY[selector_type]
+        try:
+            return WebDriverWait(self.driver, self.timeout).until(
+                EC.presence_of_element_located((by, selector))
+            )
+        except TimeoutException:
+            raise ElementNotFoundError(f"Element not found: {selector}") from None
+
+    def _fill_field(self, element: "WebElement", field: FormField) -> None:
+        _FILLERS[field.field_type](element, field.validate_value())
+
+    def _take_screenshot(self, path: str) -> None:
+        """Write a PNG of the current page to ``path``.
+
+        Goes through CDP directly on Chromium drivers, skipping the
+        base64-over-JSON detour save_screenshot takes; other drivers fall
+        back to save_screenshot. Failures are logged, never raised —
+        screenshots are debugging aids and must not abort the run.
+        """
+        from selenium.common.exceptions import WebDriverException
+
+        assert self.driver is not None
+        try:
+            dirname = os.path.dirname(path)
+            if dirname:
+                os.makedirs(dirname, exist_ok=True)
+        except OSError:
+            logger.warning("screenshot.write_failed", path=path)
+            return
+        cdp = getattr(self.driver, "execute_cdp_cmd", None)
+        if cdp is not None:
+            try:
+                shot = cdp("Page.captureScreenshot", {"format": "png"})
+                with open(path, "wb") as f:
+                    f.write(base64.b64decode(shot["data"]))
+                return
+            except WebDriverException:
+                logger.warning("screenshot.cdp_failed", path=path)
+            except OSError:
+                logger.warning("screenshot.write_failed", path=path)
+                return
+        try:
+            self.driver.save_screenshot(path)
+        except WebDriverException:
+            logger.warning("screenshot.fallback_failed", path=path)